@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, cast
@@ -7,14 +9,19 @@ from typing import TYPE_CHECKING, Callable, cast
 from advanced_alchemy.extensions.litestar._utils import get_aa_scope_state, set_aa_scope_state
 from advanced_alchemy.extensions.litestar.plugins.init.config import SQLAlchemyAsyncConfig
 from advanced_alchemy.utils.text import slugify
-from litestar import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 if TYPE_CHECKING:
+    from advanced_alchemy.alembic.commands import AlembicCommands
     from litestar.datastructures.state import State
     from litestar.types import Scope
+    from sqlalchemy.ext.asyncio import AsyncEngine
 
 ALEMBIC_TEMPLATE_PATH = Path(__file__).parent / "alembic_templates"
+_ORG_SLUG_KEY = "organisation_slug"
+"""Path parameter holding the tenant organisation slug."""
+_SAFE_SLUG = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+"""Slugs matching this pattern are already normalised and can skip ``slugify``."""
 
 
 @dataclass
@@ -30,6 +37,78 @@ class SQLAlchemyMultiTenantAsyncConfig(SQLAlchemyAsyncConfig):
     tenant_revision_name: str = field(default="tenant")
     """Prefix for tenant schema names."""
     tenant_schema_separator: str = field(default="_")
+    tenant_engine_cache_size: int = field(default=1024)
+    """Maximum number of tenant engines and slug to schema name mappings kept in memory."""
+    _engine_cache: OrderedDict[str, AsyncEngine] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    """Most recently used tenant engines with ``schema_translate_map`` applied, keyed by schema name."""
+    _schema_names: OrderedDict[tuple[str, str, str], str] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    """Tenant schema names keyed by schema prefix, separator and organisation slug."""
+    _alembic_commands: dict[str, AlembicCommands] = field(default_factory=dict, init=False, repr=False, compare=False)
+    """Alembic commands keyed by their script location."""
+
+    def get_tenant_schema_name(self, organisation_slug: str) -> str:
+        """Return the schema name of the tenant identified by ``organisation_slug``.
+
+        Args:
+            organisation_slug: The organisation slug taken from the path.
+
+        Returns:
+            The tenant schema name.
+        """
+        if _SAFE_SLUG.fullmatch(organisation_slug):
+            return f"{self.tenant_schema_prefix}{organisation_slug.replace('-', self.tenant_schema_separator)}"
+        return f"{self.tenant_schema_prefix}{slugify(organisation_slug, separator=self.tenant_schema_separator)}"
+
+    def get_tenant_engine(self, engine: AsyncEngine, organisation_slug: str) -> AsyncEngine:
+        """Return ``engine`` bound to the tenant schema of ``organisation_slug``.
+
+        The returned engine shares the connection pool of ``engine``, so evicted entries need no cleanup.
+
+        Args:
+            engine: The application engine, i.e. ``state[self.engine_app_state_key]``.
+            organisation_slug: The organisation slug taken from the path.
+
+        Returns:
+            An engine with the tenant ``schema_translate_map`` applied.
+        """
+        key = (self.tenant_schema_prefix, self.tenant_schema_separator, organisation_slug)
+        schema_name = self._schema_names.get(key)
+        if schema_name is None:
+            schema_name = self._schema_names[key] = self.get_tenant_schema_name(organisation_slug)
+            if len(self._schema_names) > self.tenant_engine_cache_size:
+                self._schema_names.popitem(last=False)
+        tenant_engine = self._engine_cache.get(schema_name)
+        if tenant_engine is None:
+            tenant_engine = engine.execution_options(schema_translate_map={None: schema_name})
+            self._engine_cache[schema_name] = tenant_engine
+            if len(self._engine_cache) > self.tenant_engine_cache_size:
+                self._engine_cache.popitem(last=False)
+        else:
+            self._engine_cache.move_to_end(schema_name)
+        return tenant_engine
+
+    def get_alembic_commands(self, revision_type: str) -> AlembicCommands:
+        """Return alembic commands using the script location of ``revision_type``.
+
+        Args:
+            revision_type: The revision type, i.e. the core or tenant revision name.
+
+        Returns:
+            Alembic commands pointing at ``<script_location>/<revision_type>``.
+        """
+        script_location = f"{self.alembic_config.script_location}/{revision_type}"
+        alembic_commands = self._alembic_commands.get(script_location)
+        if alembic_commands is None:
+            from advanced_alchemy.alembic.commands import AlembicCommands
+
+            alembic_commands = AlembicCommands(sqlalchemy_config=self)
+            alembic_commands.config.set_main_option("script_location", script_location)
+            self._alembic_commands[script_location] = alembic_commands
+        return alembic_commands
 
     def provide_session(self, state: State, scope: Scope) -> AsyncSession:
         """Create a session instance.
@@ -42,22 +121,13 @@ class SQLAlchemyMultiTenantAsyncConfig(SQLAlchemyAsyncConfig):
             A session instance.
         """
         session = cast("AsyncSession | None", get_aa_scope_state(scope, self.session_scope_key))
-        request = Request(scope)  # type: ignore
-        engine = self.get_engine()
-        schema_translation_map = None
-
-        organisation_slug = request.path_params.get("organisation_slug", None)
-
-        if organisation_slug:
-            schema_name = (
-                f"{self.tenant_schema_prefix}{slugify(organisation_slug, separator=self.tenant_schema_separator)}"
-            )
-            schema_translation_map = {None: f"{schema_name}"}
 
         if session is None:
+            organisation_slug = (scope.get("path_params") or {}).get(_ORG_SLUG_KEY)
             session_maker = cast("Callable[[], AsyncSession]", state[self.session_maker_app_state_key])
-            if schema_translation_map:
-                session = session_maker(bind=engine.execution_options(schema_translate_map=schema_translation_map))  # type: ignore
+            if organisation_slug:
+                engine = cast("AsyncEngine", state[self.engine_app_state_key])
+                session = session_maker(bind=self.get_tenant_engine(engine, organisation_slug))  # type: ignore
             else:
                 session = session_maker()
             set_aa_scope_state(scope, self.session_scope_key, session)
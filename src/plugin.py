@@ -21,13 +21,15 @@ class SQLAlchemyInitMultiTenantPlugin(SQLAlchemyInitPlugin):
         Args:
             config: configure DB connection and hook handlers and dependencies.
         """
-        self._config = config
+        self._config: tuple[SQLAlchemyMultiTenantAsyncConfig, ...] = (
+            tuple(config) if isinstance(config, Sequence) else (config,)
+        )
 
     @property
     def config(
         self,
     ) -> Sequence[SQLAlchemyMultiTenantAsyncConfig]:
-        return self._config if isinstance(self._config, Sequence) else [self._config]
+        return self._config
 
     def on_cli_init(self, cli: Group) -> None:
         from .plugin_commands import database_group
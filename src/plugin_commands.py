@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING, Sequence, cast
 
-from anyio import run
+from advanced_alchemy.exceptions import ImproperConfigurationError
+from anyio import create_task_group, run
 from click import Path as ClickPath
 from click import argument, group, option, Choice, prompt, BadOptionUsage
 from litestar.cli._utils import LitestarGroup, console
+from rich.prompt import Confirm, Prompt
+from rich.traceback import Traceback
 
 if TYPE_CHECKING:
     from litestar import Litestar
@@ -25,30 +27,23 @@ def get_database_migration_plugin(app: Litestar) -> SQLAlchemyInitMultiTenantPlu
     This function attempts to find and return either the SQLAlchemyPlugin or SQLAlchemyInitPlugin or SQLAlchemyInitMultiTenantPlugin.
     If neither plugin is found, it raises an ImproperlyConfiguredException.
     """
-    from advanced_alchemy.exceptions import ImproperConfigurationError
-
-    with suppress(KeyError):
+    try:
         return app.plugins.get(SQLAlchemyInitMultiTenantPlugin)
-    msg = "Failed to initialize database migrations. The required plugin (SQLAlchemyPlugin or SQLAlchemyInitPlugin) is missing."
-    raise ImproperConfigurationError(msg)
-
-
-def is_valid_revision_type(revision_type: str, valid_revision_type: list[str]) -> bool:
-    """Validates revision_type entered by the user with the plugin configuration"""
-    if revision_type in valid_revision_type:
-        return True
-    return False
+    except KeyError as exc:
+        msg = "Failed to initialize database migrations. The required plugin (SQLAlchemyPlugin or SQLAlchemyInitPlugin) is missing."
+        raise ImproperConfigurationError(msg) from exc
 
 
 def prompt_and_validate_revision(revision_type: str | None, valid_revision_type: list[str]) -> str:
     """Prompt if revision type is none and validate revision"""
-    revision_type = revision_type or prompt(
-        "Revision type",
-        type=Choice(valid_revision_type, case_sensitive=True),
-        show_default=False,
-    )
-    if not is_valid_revision_type(revision_type, valid_revision_type):
-        BadOptionUsage("Revision type should be one of [{}|{}]".format(*valid_revision_type))
+    if not revision_type:
+        return prompt(
+            "Revision type",
+            type=Choice(valid_revision_type, case_sensitive=True),
+            show_default=False,
+        )
+    if revision_type not in valid_revision_type:
+        raise BadOptionUsage("--revision-type", f"Revision type should be one of {', '.join(valid_revision_type)}")
     return revision_type
 
 
@@ -65,8 +60,6 @@ def database_group() -> None:
 @option("--verbose", type=bool, help="Enable verbose output.", default=False, is_flag=True)
 def show_database_revision(app: Litestar, revision_type: str, verbose: bool) -> None:
     """Show current database revision."""
-    from advanced_alchemy.alembic.commands import AlembicCommands
-
     console.rule("[yellow]Listing current revision[/]", align="left")
     config = get_database_migration_plugin(app).config
     sqlalchemy_config = config[0]
@@ -77,11 +70,7 @@ def show_database_revision(app: Litestar, revision_type: str, verbose: bool) ->
     ]
     revision_type = prompt_and_validate_revision(revision_type, valid_revision)
 
-    alembic_commands = AlembicCommands(sqlalchemy_config=sqlalchemy_config)
-    alembic_commands.config.set_main_option(
-        "script_location",
-        f"{sqlalchemy_config.alembic_config.script_location}/{revision_type}",
-    )
+    alembic_commands = sqlalchemy_config.get_alembic_commands(revision_type)
     alembic_commands.current(verbose=verbose)
 
 
@@ -126,10 +115,6 @@ def downgrade_database(
     no_prompt: bool,
 ) -> None:
     """Downgrade the database to the latest revision."""
-    from rich.prompt import Confirm
-
-    from advanced_alchemy.alembic.commands import AlembicCommands
-
     console.rule("[yellow]Starting database downgrade process[/]", align="left")
     input_confirmed = (
         True
@@ -148,11 +133,7 @@ def downgrade_database(
         ]
         revision_type = prompt_and_validate_revision(revision_type, valid_revision)
 
-        alembic_commands = AlembicCommands(sqlalchemy_config=sqlalchemy_config)
-        alembic_commands.config.set_main_option(
-            "script_location",
-            f"{sqlalchemy_config.alembic_config.script_location}/{revision_type}",
-        )
+        alembic_commands = sqlalchemy_config.get_alembic_commands(revision_type)
         alembic_commands.downgrade(revision=revision, sql=sql, tag=tag)
 
 
@@ -197,10 +178,6 @@ def upgrade_database(
     no_prompt: bool,
 ) -> None:
     """Upgrade the database to the latest revision."""
-    from rich.prompt import Confirm
-
-    from advanced_alchemy.alembic.commands import AlembicCommands
-
     console.rule("[yellow]Starting database upgrade process[/]", align="left")
     input_confirmed = (
         True
@@ -219,11 +196,7 @@ def upgrade_database(
         ]
         revision_type = prompt_and_validate_revision(revision_type, valid_revision)
 
-        alembic_commands = AlembicCommands(sqlalchemy_config=sqlalchemy_config)
-        alembic_commands.config.set_main_option(
-            "script_location",
-            f"{sqlalchemy_config.alembic_config.script_location}/{revision_type}",
-        )
+        alembic_commands = sqlalchemy_config.get_alembic_commands(revision_type)
         alembic_commands.upgrade(revision=revision, sql=sql, tag=tag)
 
 
@@ -250,8 +223,6 @@ def upgrade_database(
 )
 def init_alembic(app: Litestar, directory: str | None, multidb: bool, package: bool, no_prompt: bool) -> None:
     """Upgrade the database to the latest revision."""
-    from rich.prompt import Confirm
-
     from advanced_alchemy.alembic.commands import AlembicCommands
 
     console.rule("[yellow]Initializing database migrations.", align="left")
@@ -331,9 +302,6 @@ def create_revision(
     no_prompt: bool,
 ) -> None:
     """Create a new database revision."""
-    from rich.prompt import Prompt
-
-    from advanced_alchemy.alembic.commands import AlembicCommands
 
     def process_revision_directives(
         context: MigrationContext,  # noqa: ARG001
@@ -374,11 +342,7 @@ def create_revision(
     ]
     revision_type = prompt_and_validate_revision(revision_type, valid_revision)
 
-    alembic_commands = AlembicCommands(sqlalchemy_config=sqlalchemy_config)
-    alembic_commands.config.set_main_option(
-        "script_location",
-        f"{sqlalchemy_config.alembic_config.script_location}/{revision_type}",
-    )
+    alembic_commands = sqlalchemy_config.get_alembic_commands(revision_type)
     alembic_commands.revision(
         message=message,
         autogenerate=autogenerate,
@@ -429,10 +393,6 @@ def merge_revisions(
     no_prompt: bool,
 ) -> None:
     """Merge multiple revisions into a single new revision."""
-    from rich.prompt import Prompt
-
-    from advanced_alchemy.alembic.commands import AlembicCommands
-
     console.rule("[yellow]Starting database upgrade process[/]", align="left")
     if message is None:
         message = "autogenerated" if no_prompt else Prompt.ask("Please enter a message describing this revision")
@@ -446,11 +406,7 @@ def merge_revisions(
     ]
     revision_type = prompt_and_validate_revision(revision_type, valid_revision)
 
-    alembic_commands = AlembicCommands(sqlalchemy_config=sqlalchemy_config)
-    alembic_commands.config.set_main_option(
-        "script_location",
-        f"{sqlalchemy_config.alembic_config.script_location}/{revision_type}",
-    )
+    alembic_commands = sqlalchemy_config.get_alembic_commands(revision_type)
     alembic_commands.merge(message=message, revisions=revisions, branch_label=branch_label, rev_id=rev_id)
 
 
@@ -504,10 +460,6 @@ def stamp_revision(
     no_prompt: bool,
 ) -> None:
     """Create a new database revision."""
-    from rich.prompt import Confirm
-
-    from advanced_alchemy.alembic.commands import AlembicCommands
-
     console.rule("[yellow]Stamping database revision as current[/]", align="left")
 
     config = get_database_migration_plugin(app).config
@@ -525,20 +477,7 @@ def stamp_revision(
         else Confirm.ask(f"Are you sure you want to stamp revision as current for {revision_type} schema?")
     )
     if input_confirmed:
-        config = get_database_migration_plugin(app).config
-        sqlalchemy_config = config[0]
-
-        valid_revision = [
-            sqlalchemy_config.core_revision_name,
-            sqlalchemy_config.tenant_revision_name,
-        ]
-        revision_type = prompt_and_validate_revision(revision_type, valid_revision)
-
-        alembic_commands = AlembicCommands(sqlalchemy_config=sqlalchemy_config)
-        alembic_commands.config.set_main_option(
-            "script_location",
-            f"{sqlalchemy_config.alembic_config.script_location}/{revision_type}",
-        )
+        alembic_commands = sqlalchemy_config.get_alembic_commands(revision_type)
         alembic_commands.stamp(sql=sql, revision=revision, tag=tag, purge=purge)
 
 
@@ -553,8 +492,6 @@ def stamp_revision(
     is_flag=True,
 )
 def drop_all(app: Litestar, no_prompt: bool) -> None:
-    from rich.prompt import Confirm
-
     from sqlalchemy import inspect, text
 
     console.rule("[yellow]Dropping all tables from the database[/]", align="left")
@@ -569,19 +506,16 @@ def drop_all(app: Litestar, no_prompt: bool) -> None:
             engine = config.get_engine()
 
             async with engine.connect() as connection:
-                # Drop tenant schemas first
                 all_schemas = await connection.run_sync(lambda sync_conn: inspect(sync_conn).get_schema_names())
                 tenant_schemas = [schema for schema in all_schemas if schema.startswith(config.tenant_schema_prefix)]
+                quote_schema = connection.dialect.identifier_preparer.quote_schema
 
-                # Drop all tenant schemas and their tables
-                for schema in tenant_schemas:
-                    await connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+                # Drop tenant schemas first, then the core schema. Each drop is committed on its own
+                # so the locks on a schema's objects are released before the next one is dropped.
+                for schema in [*tenant_schemas, config.core_schema_name]:
+                    await connection.execute(text(f"DROP SCHEMA IF EXISTS {quote_schema(schema)} CASCADE"))
                     await connection.commit()
 
-                # Now drop core schema and tables
-                await connection.execute(text(f"DROP SCHEMA IF EXISTS {config.core_schema_name} CASCADE"))
-                await connection.commit()
-
     if input_confirmed:
         run(
             _drop_all,
@@ -608,8 +542,6 @@ def drop_all(app: Litestar, no_prompt: bool) -> None:
     required=False,
 )
 def dump_table_data(app: Litestar, table_names: tuple[str, ...], dump_dir: Path) -> None:
-    from rich.prompt import Confirm
-
     all_tables = "*" in table_names
 
     if all_tables and not Confirm.ask(
@@ -624,25 +556,51 @@ def dump_table_data(app: Litestar, table_names: tuple[str, ...], dump_dir: Path)
     from advanced_alchemy.base import metadata_registry, orm_registry
 
     configs = get_database_migration_plugin(app).config
+    requested_tables = frozenset(table_names)
+    # all configs share the default orm registry, so map table names to models once
+    models_by_table: dict[str, list[type]] = {}
+    for mapper in orm_registry.mappers:
+        models_by_table.setdefault(mapper.class_.__table__.name, []).append(mapper.class_)
+
+    async def _dump_one(config: SQLAlchemyMultiTenantAsyncConfig) -> None:
+        label = config.bind_key or "default"
+        target_tables = set(metadata_registry.get(config.bind_key).tables)
+
+        if not all_tables:
+            # only consider tables specified by user
+            for table_name in requested_tables - target_tables:
+                console.rule(
+                    f"[red bold]{label}: Skipping table '{table_name}' because it is not available in the default registry",
+                    style="red",
+                    align="left",
+                )
+            target_tables &= requested_tables
+        else:
+            console.rule(f"[yellow bold]{label}: Dumping all tables", style="yellow", align="left")
+
+        models = [model for table in sorted(target_tables) for model in models_by_table.get(table, ())]
+        await dump_tables(dump_dir, config.get_session(), models)
+        console.rule(f"[green bold]{label}: Data dump complete", align="left")
 
     async def _dump_tables() -> None:
-        for config in configs:
-            target_tables = set(metadata_registry.get(config.bind_key).tables)
-
-            if not all_tables:
-                # only consider tables specified by user
-                for table_name in set(table_names) - target_tables:
-                    console.rule(
-                        f"[red bold]Skipping table '{table_name}' because it is not available in the default registry",
-                        style="red",
-                        align="left",
-                    )
-                target_tables.intersection_update(table_names)
-            else:
-                console.rule("[yellow bold]Dumping all tables", style="yellow", align="left")
-
-            models = [mapper.class_ for mapper in orm_registry.mappers if mapper.class_.__table__.name in target_tables]
-            await dump_tables(dump_dir, config.get_session(), models)
-            console.rule("[green bold]Data dump complete", align="left")
+        # dump each config concurrently, each with its own session
+        errors: list[Exception] = []
+
+        async def _dump_or_record(config: SQLAlchemyMultiTenantAsyncConfig) -> None:
+            try:
+                await _dump_one(config)
+            except Exception as exc:
+                # let the other dumps finish instead of cancelling them
+                console.rule(f"[red bold]{config.bind_key or 'default'}: Data dump failed", style="red", align="left")
+                errors.append(exc)
+
+        async with create_task_group() as task_group:
+            for config in configs:
+                task_group.start_soon(_dump_or_record, config)
+        if errors:
+            # the first error is re-raised below, report the remaining ones with their tracebacks
+            for exc in errors[1:]:
+                console.print(Traceback.from_exception(type(exc), exc, exc.__traceback__))
+            raise errors[0]
 
     return run(_dump_tables)